@@ -333,10 +333,9 @@ class ResultContainer:
                     PptyLvlHeader += ElmLvlHeader
                 if self.__Settings['Exports']['Export Style'] == 'Single file':
                     assert Class_ElementDatasets
-                    Dataset = Class_ElementDatasets[0]
-                    if len(Class_ElementDatasets) > 1:
-                        for D in Class_ElementDatasets[1:]:
-                            Dataset = np.append(Dataset, D, axis=1)
+                    # Join all element arrays at once; appending one at a time
+                    # copies the growing dataset for every element.
+                    Dataset = np.concatenate(Class_ElementDatasets, axis=1)
                     columns = [x for x in PptyLvlHeader.split(',') if x != '']
                     tuples = list(zip(*[self.__DateTime, self.__Frequency, self.__SimulationMode]))
                     index = pd.MultiIndex.from_tuples(tuples, names=['timestamp', 'frequency', 'Simulation mode'])
@@ -386,10 +385,7 @@ class ResultContainer:
                     ElementDatasets.append(Data)
                 AllHeader += Header
             if self.__Settings['Exports']['Export Style'] == 'Single file':
-                Dataset = ElementDatasets[0]
-                if len(ElementDatasets) > 0:
-                    for D in ElementDatasets[1:]:
-                        Dataset = np.append(Dataset, D, axis=1)
+                Dataset = np.concatenate(ElementDatasets, axis=1)
                 fname = '-'.join([Element, str(self.__StartDay), str(self.__EndDay), fileprefix])
                 columns = [x for x in AllHeader.split(',') if x != '']
                 tuples = list(zip(*[self.__DateTime, self.__Frequency, self.__SimulationMode]))
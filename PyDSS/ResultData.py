@@ -58,6 +58,7 @@ class ResultData:
         self._export_compression = options["Exports"]["Export Compression"]
         self._export_iteration_order = options["Exports"]["Export Iteration Order"]
         self._max_chunk_bytes = options["Exports"]["HDF Max Chunk Bytes"]
+        self._compression = options["Exports"]["HDF Compression"]
         self._export_dir = os.path.join(
             self.system_paths["Export"],
             options["Project"]["Active Scenario"],
@@ -113,7 +114,8 @@ class ResultData:
                                 name,
                                 obj,
                                 max_chunk_bytes=self._max_chunk_bytes,
-                                options=self._options
+                                options=self._options,
+                                compression=self._compression,
                             )
                         elements[name].append_property(prop)
                         self._logger.debug("Store %s %s name=%s", elem_class, prop.name, name)
@@ -130,7 +132,8 @@ class ResultData:
             max_size=num_steps,
             dtype=float,
             columns=("Timestamp",),
-            max_chunk_bytes=self._max_chunk_bytes
+            max_chunk_bytes=self._max_chunk_bytes,
+            compression=self._compression,
         )
         self._frequency_dataset = DatasetBuffer(
             hdf_store=hdf_store,
@@ -138,7 +141,8 @@ class ResultData:
             max_size=num_steps,
             dtype=float,
             columns=("Frequency",),
-            max_chunk_bytes=self._max_chunk_bytes
+            max_chunk_bytes=self._max_chunk_bytes,
+            compression=self._compression,
         )
         self._mode_dataset = DatasetBuffer(
             hdf_store=hdf_store,
@@ -146,7 +150,8 @@ class ResultData:
             max_size=num_steps,
             dtype="S10",
             columns=("Mode",),
-            max_chunk_bytes=self._max_chunk_bytes
+            max_chunk_bytes=self._max_chunk_bytes,
+            compression=self._compression,
         )
 
         for element in self._elements:
@@ -350,7 +355,8 @@ class ResultData:
 
 class ElementData:
     """Stores all property data for an element."""
-    def __init__(self, name, obj, max_chunk_bytes, options, scenario=None, hdf_store=None):
+    def __init__(self, name, obj, max_chunk_bytes, options, scenario=None, hdf_store=None,
+                 compression=None):
         self._properties = []
         self._name = name
         self._obj = obj
@@ -362,6 +368,7 @@ class ElementData:
         self._scenario = scenario
         self._hdf_store = hdf_store
         self._max_chunk_bytes = max_chunk_bytes
+        self._compression = compression
         self._options = options
         self._step_number = 1
 
@@ -424,11 +431,12 @@ class ElementData:
                     cached_values[value_key] = value
             if not self._should_store_by_type[prop.store_values_type](prop, prop_key, value):
                 continue
-            if len(value.make_columns()) > 1:
-                for column, val in zip(value.make_columns(), value.value):
+            columns = value.make_columns()
+            if len(columns) > 1:
+                for column, val in zip(columns, value.value):
                     curr_data[column] = val
             else:
-                curr_data[value.make_columns()[0]] = value.value
+                curr_data[columns[0]] = value.value
             if self._data[prop_key] is None:
                 path = f"Exports/{self._scenario}/{prop.elem_class}/{self._name}/{prop.storage_name}"
                 self._data[prop_key] = ValueContainer(
@@ -439,6 +447,7 @@ class ElementData:
                     dataset_property_type=prop.get_dataset_property_type(),
                     max_chunk_bytes=self._max_chunk_bytes,
                     store_timestamp=prop.should_store_timestamp(),
+                    compression=self._compression,
                 )
 
             self._data[prop_key].append(value, timestamp=timestamp)
@@ -499,6 +508,7 @@ class ElementData:
                 1,
                 max_chunk_bytes=self._max_chunk_bytes,
                 dataset_property_type=DatasetPropertyType.NUMBER,
+                compression=self._compression,
             )
             container.append(value)
             container.flush_data()
@@ -514,6 +524,7 @@ class ElementData:
                 1,
                 max_chunk_bytes=self._max_chunk_bytes,
                 dataset_property_type=DatasetPropertyType.NUMBER,
+                compression=self._compression,
             )
             container.append(value)
             container.flush_data()
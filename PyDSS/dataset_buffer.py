@@ -5,6 +5,8 @@ import logging
 import numpy as np
 import pandas as pd
 
+from PyDSS.exceptions import InvalidParameter
+
 
 KiB = 1024
 MiB = KiB * KiB
@@ -19,6 +21,15 @@ GiB = MiB * MiB
 # parallel processes would require 54 GiB of RAM.
 DEFAULT_MAX_CHUNK_BYTES = 32 * KiB
 
+# Inline compression filter applied to all datasets. lzf is considerably
+# faster than gzip at the cost of a lower compression ratio.
+DEFAULT_COMPRESSION = "gzip"
+COMPRESSION_OPTIONS = {
+    "gzip": 4,
+    "lzf": None,
+    "none": None,
+}
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +38,9 @@ class DatasetBuffer:
     Users must call flush_data before the object goes out of scope to ensure
     that all data is flushed.
 
+    Full buffers are written to the dataset with a single write. The dataset's
+    length attribute is only updated by flush_data.
+
     """
     # TODO add support for context manager, though PyDSS wouldn't be able to
     # take advantage in its current implementation.
@@ -34,11 +48,21 @@ class DatasetBuffer:
 
     def __init__(
             self, hdf_store, path, max_size, dtype, columns, scaleoffset=None,
-            max_chunk_bytes=None, attributes=None
+            max_chunk_bytes=None, attributes=None, compression=None
         ):
+        # These must be set before anything can fail so that __del__ works.
+        self._buf_index = 0
+        self._dataset_index = 0
+        self._length = 0  # value of the length attribute
         if max_chunk_bytes is None:
             max_chunk_bytes = DEFAULT_MAX_CHUNK_BYTES
-        self._buf_index = 0
+        if compression is None:
+            compression = DEFAULT_COMPRESSION
+        if compression not in COMPRESSION_OPTIONS:
+            raise InvalidParameter(f"unsupported HDF compression: {compression}")
+        compression_opts = COMPRESSION_OPTIONS[compression]
+        if compression == "none":
+            compression = None
         self._hdf_store = hdf_store
         self._max_size = max_size
         num_columns = len(columns)
@@ -60,13 +84,12 @@ class DatasetBuffer:
             shape=shape,
             chunks=chunks,
             dtype=dtype,
-            compression="gzip",
-            compression_opts=4,
-            shuffle=True,
+            compression=compression,
+            compression_opts=compression_opts,
+            shuffle=compression is not None,
             scaleoffset=scaleoffset,
         )
         self._dataset.attrs["columns"] = columns
-        self._dataset_index = 0
         self._path = path
         self._buf = np.empty(chunks, dtype=dtype)
 
@@ -75,11 +98,17 @@ class DatasetBuffer:
                 self._dataset.attrs[attr] = val
 
     def __del__(self):
-        assert self._buf_index == 0, \
+        assert self._buf_index == 0 and self._length == self._dataset_index, \
             f"DatasetBuffer destructed with data in memory: {self._path}"
 
     def flush_data(self):
         """Flush the data in the temporary buffer to storage."""
+        self._write_buffer()
+        if self._length != self._dataset_index:
+            self._dataset.attrs["length"] = self._dataset_index
+            self._length = self._dataset_index
+
+    def _write_buffer(self):
         length = self._buf_index
         if length == 0:
             return
@@ -88,7 +117,6 @@ class DatasetBuffer:
         self._dataset[self._dataset_index:new_index] = self._buf[0:length]
         self._buf_index = 0
         self._dataset_index = new_index
-        self._dataset.attrs["length"] = new_index
 
     def max_num_bytes(self):
         """Return the maximum number of bytes the container could hold.
@@ -106,7 +134,7 @@ class DatasetBuffer:
         self._buf[self._buf_index] = value
         self._buf_index += 1
         if self._buf_index == self._chunk_size:
-            self.flush_data()
+            self._write_buffer()
 
     @staticmethod
     def compute_chunk_count(
@@ -117,7 +145,8 @@ class DatasetBuffer:
         ):
         tmp = np.empty((1, num_columns), dtype=dtype)
         size_one_row = tmp.size * tmp.itemsize
-        chunk_count = min(int(max_chunk_bytes / size_one_row), max_size)
+        # Rows wider than max_chunk_bytes still need a chunk of one row.
+        chunk_count = max(1, min(int(max_chunk_bytes / size_one_row), max_size))
         logger.debug("chunk_count=%s", chunk_count)
         return chunk_count
 
@@ -1,5 +1,9 @@
+import logging
+
 from  PyDSS.pyControllers.pyControllerAbstract import ControllerAbstract
 
+logger = logging.getLogger(__name__)
+
 class FaultController(ControllerAbstract):
     """The class is used to induce faults on bus for dynamic simulation studies. Subclass of the :class:`PyDSS.pyControllers.pyControllerAbstract.ControllerAbstract` abstract class. 
 
@@ -33,7 +37,7 @@ class FaultController(ControllerAbstract):
         FaultObj.SetParameter('bus2', Settings['Bus2'])
         FaultObj.SetParameter('phases', nPhases)
         FaultObj.SetParameter('r', Settings['Fault resistance'])
-        print(FaultObj, Settings, nPhases)
+        logger.debug("FaultController settings=%s phases=%s", Settings, nPhases)
         Class, Name = self.__FaultObj.GetInfo()
         assert (Class.lower() == 'fault'), 'FaultController works only with an OpenDSS Fault element'
         self.__Name = 'pyCont_' + Class + '_' + Name
@@ -1,37 +1,52 @@
-from os.path import dirname, basename, isfile
-import glob
+import functools
+import importlib
+import logging
+import pkgutil
 
 from  PyDSS.pyControllers import Controllers
+from PyDSS.dssElementFactory import create_dss_element
 
-modules = glob.glob(Controllers.__path__[0]+"/*.py")
-pythonFiles = [ basename(f)[:-3] for f in modules if isfile(f) and not f.endswith('__init__.py') ]
-
-from PyDSS.dssElement import dssElement
+# Controller classes are imported on first use and cached here.
 ControllerTypes = {}
 
-for file in pythonFiles:
-    exec('from PyDSS.pyControllers.Controllers import {}'.format(file))
-    exec('ControllerTypes["{}"] = {}.{}'.format(file, file, file))
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_controller_names():
+    return frozenset(
+        name for _, name, is_pkg in pkgutil.iter_modules(Controllers.__path__) if not is_pkg
+    )
+
+
+def _get_controller_class(ControllerType):
+    controller_class = ControllerTypes.get(ControllerType)
+    if controller_class is None and ControllerType in _list_controller_names():
+        module = importlib.import_module("{}.{}".format(Controllers.__name__, ControllerType))
+        controller_class = getattr(module, ControllerType)
+        ControllerTypes[ControllerType] = controller_class
+        logger.debug("Loaded controller type %s", ControllerType)
+    return controller_class
+
 
 def Create(ElmName, ControllerType, Settings, ElmObjectList, dssInstance, dssSolver):
 
-    assert (ControllerType in ControllerTypes), "Definition for '{}' controller not found. \n " \
-                                                "Please define the controller in ~PyDSS\pyControllers\Controllers".format(
+    controller_class = _get_controller_class(ControllerType)
+    assert (controller_class is not None), "Definition for '{}' controller not found. \n " \
+                                           "Please define the controller in ~PyDSS\pyControllers\Controllers".format(
         ControllerType
     )
-    # try:
-        #print(ElmObjectList)
-    assert (ElmName in ElmObjectList), "'{}' does not exist in the PyDSS master object dictionary.".format(ElmName)
-    relObject = ElmObjectList[ElmName]
-    # except:
-    #     Index = dssInstance.Circuit.SetActiveElement(ElmName)
-    #     if int(Index) >= 0:
-    #         ElmObjectList[ElmName] = dssElement(dssInstance)
-    #         relObject = ElmObjectList[ElmName]
-    # else:
-    #     print('The controller dictionary does not contain {}'.format(ElmName))
-    #     return -1
-
-
-    ObjectController = ControllerTypes[ControllerType](relObject, Settings, dssInstance, ElmObjectList, dssSolver)
+    relObject = ElmObjectList.get(ElmName)
+    if relObject is None:
+        # Fall back to OpenDSS for elements missing from the master object
+        # dictionary and cache the new object for subsequent controllers.
+        Index = dssInstance.Circuit.SetActiveElement(ElmName)
+        assert int(Index) >= 0, "'{}' does not exist in the PyDSS master object dictionary.".format(ElmName)
+        Class, Name = ElmName.split('.', 1)
+        relObject = create_dss_element(Class, Name, dssInstance)
+        ElmObjectList[ElmName] = relObject
+        logger.debug("Added %s to the PyDSS master object dictionary", ElmName)
+
+    logger.debug("Creating %s controller for %s with settings %s", ControllerType, ElmName, Settings)
+    ObjectController = controller_class(relObject, Settings, dssInstance, ElmObjectList, dssSolver)
     return ObjectController
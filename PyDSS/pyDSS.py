@@ -62,6 +62,7 @@ class instance(object):
             'Export Data In Memory': {'type': bool, 'Options': [True, False]},
             'Export PV Profiles': {'type': bool, 'Options': [True, False]},
             'HDF Max Chunk Bytes': {'type': int, 'Options': range(16 * 1024, 1024 * 1024 + 1)},
+            'HDF Compression': {'type': str, 'Options': ["gzip", "lzf", "none"]},
             'Log Results': {'type': bool, 'Options': [True, False]},
             'Result Container': {'type': str, 'Options': ['ResultContainer', 'ResultData']},
         },
@@ -121,6 +122,7 @@ class instance(object):
             'Return Results': {'type': bool, 'Options': [True, False]},
             'Control mode': {'type': str, 'Options': ["Static", "Time"]},
             'Disable PyDSS controllers': {'type': bool, 'Options': [True, False]},
+            'Max Parallel Scenarios': {'type': int},
         },
         "Reports": {
             'Format': {'type': str, 'Options': ["csv", "h5"]},
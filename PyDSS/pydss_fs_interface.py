@@ -366,11 +366,12 @@ class PyDssArchiveFileInterfaceBase(PyDssFileSystemInterface):
 class PyDssTarFileInterface(PyDssArchiveFileInterfaceBase):
     """Reads PyDSS files when the project is archived in tar file."""
     def __init__(self, project_dir):
+        self._tar = None
         self._tar = tarfile.open(os.path.join(project_dir, PROJECT_TAR))
         super(PyDssTarFileInterface, self).__init__(project_dir)
 
     def __del__(self):
-        if not self._tar.closed:
+        if self._tar is not None and not self._tar.closed:
             self._tar.close()
 
     def read_file(self, path):
@@ -383,11 +384,13 @@ class PyDssTarFileInterface(PyDssArchiveFileInterfaceBase):
 class PyDssZipFileInterface(PyDssArchiveFileInterfaceBase):
     """Reads PyDSS files when the project is archived in zip file."""
     def __init__(self, project_dir):
+        self._zip = None
         self._zip = zipfile.ZipFile(os.path.join(project_dir, PROJECT_ZIP))
         super(PyDssZipFileInterface, self).__init__(project_dir)
 
     def __del__(self):
-        self._zip.close()
+        if self._zip is not None:
+            self._zip.close()
 
     def read_file(self, path):
         data = self._zip.read(path)
@@ -1,6 +1,10 @@
 """Contains functionality to configure PyDSS simulations."""
 
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import functools
 import logging
+import multiprocessing
 import os
 import shutil
 import tarfile
@@ -31,6 +35,10 @@ logger = logging.getLogger(__name__)
 
 DATA_FORMAT_VERSION = "1.0.1"
 
+# Project zip files mostly contain text files. Low levels give most of the
+# size reduction without slowing down archiving.
+ARCHIVE_COMPRESSION_LEVEL = 3
+
 
 class PyDssProject:
     """Represents the project options for a PyDSS simulation."""
@@ -41,6 +49,7 @@ class PyDssProject:
                  simulation_file=SIMULATION_SETTINGS_FILENAME):
         self._name = name
         self._scenarios = scenarios
+        self._scenarios_by_name = {x.name: x for x in scenarios}
         self._simulation_config = simulation_config
         self._project_dir = os.path.join(path, self._name)
         if simulation_file is None:
@@ -110,19 +119,11 @@ class PyDssProject:
         Returns
         -------
         str
-            Path to the HDFStore.
-
-        Raises
-        ------
-        InvalidConfiguration
-            Raised if no store exists.
+            Path to the HDFStore. The file is not checked for existence;
+            callers must handle FileNotFoundError when opening it.
 
         """
-        filename = os.path.join(self._project_dir, STORE_FILENAME)
-        if not os.path.exists(filename):
-            raise InvalidConfiguration(f"HDFStore does not exist")
-
-        return filename
+        return os.path.join(self._project_dir, STORE_FILENAME)
 
     def get_post_process_directory(self, scenario_name):
         """Return the post-process output directory for scenario_name.
@@ -154,11 +155,11 @@ class PyDssProject:
         PyDssScenario
 
         """
-        for scenario in self._scenarios:
-            if scenario.name == name:
-                return scenario
+        scenario = self._scenarios_by_name.get(name)
+        if scenario is None:
+            raise InvalidParameter(f"{name} is not a valid scenario")
 
-        raise InvalidParameter(f"{name} is not a valid scenario")
+        return scenario
 
     @property
     def name(self):
@@ -287,7 +288,7 @@ class PyDssProject:
         if self._fs_intf is None:
             raise InvalidConfiguration("pydss fs interface is not defined")
 
-        if scenario_name not in self.list_scenario_names():
+        if scenario_name not in self._scenarios_by_name:
             raise InvalidParameter(f"invalid scenario: {scenario_name}")
 
         return self._fs_intf.read_scenario_export_metadata(scenario_name)
@@ -312,16 +313,18 @@ class PyDssProject:
         else:
             store_filename = os.path.join(self._project_dir, STORE_FILENAME)
 
-        driver = None
-        if self._simulation_config["Exports"].get("Export Data In Memory", True):
-            driver = "core"
-        with h5py.File(store_filename, mode="w", driver=driver) as hdf_store:
-            self._hdf_store = hdf_store
-            self._hdf_store.attrs["version"] = DATA_FORMAT_VERSION
-            for scenario in self._scenarios:
-                self._simulation_config["Project"]["Active Scenario"] = scenario.name
-                inst.run(self._simulation_config, self, scenario, dry_run=dry_run)
-                self._estimated_space[scenario.name] = inst.get_estimated_space()
+        num_processes = self._get_num_scenario_processes()
+        if num_processes > 1:
+            self._run_scenarios_in_parallel(num_processes, store_filename, dry_run)
+        else:
+            driver, kwargs = self._get_store_options(dry_run)
+            with h5py.File(store_filename, mode="w", driver=driver, **kwargs) as hdf_store:
+                self._hdf_store = hdf_store
+                self._hdf_store.attrs["version"] = DATA_FORMAT_VERSION
+                for scenario in self._scenarios:
+                    self._simulation_config["Project"]["Active Scenario"] = scenario.name
+                    inst.run(self._simulation_config, self, scenario, dry_run=dry_run)
+                    self._estimated_space[scenario.name] = inst.get_estimated_space()
 
         if not dry_run:
             results = None
@@ -345,8 +348,76 @@ class PyDssProject:
         elif zip_project:
             self._zip_project_files()
 
-        if dry_run and os.path.exists(store_filename):
-            os.remove(store_filename)
+    def _get_store_options(self, dry_run):
+        driver = None
+        kwargs = {}
+        if dry_run:
+            # Nothing from a dry run is kept, so never write the store to disk.
+            driver = "core"
+            kwargs["backing_store"] = False
+        elif self._simulation_config["Exports"].get("Export Data In Memory", True):
+            driver = "core"
+        return driver, kwargs
+
+    def _get_num_scenario_processes(self):
+        max_processes = self._simulation_config["Project"].get("Max Parallel Scenarios", 1)
+        if self._simulation_config["Plots"].get("Create dynamic plots", False):
+            # Every scenario would start its own bokeh server.
+            max_processes = 1
+        return max(1, min(max_processes, len(self._scenarios), os.cpu_count() or 1))
+
+    def _run_scenarios_in_parallel(self, num_processes, store_filename, dry_run):
+        """Run each scenario in its own process and merge the results.
+
+        OpenDSS only supports one circuit per process, so scenarios cannot
+        share a process. Each worker writes to its own temporary HDF5 file,
+        which is copied into the project store after all workers complete.
+
+        Workers receive a pickled copy of the project. They are forked where
+        the platform supports it so that they inherit the parent's logging
+        configuration. Under spawn (Windows) every project attribute must be
+        picklable and workers start without the parent's logging handlers.
+
+        """
+        # Open HDF5 files cannot be pickled, and the project store is only
+        # opened after the workers exit so that none of them inherit it.
+        self._hdf_store = None
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = {
+                x.name: os.path.join(tmpdir, x.name + ".h5") for x in self._scenarios
+            }
+            with ProcessPoolExecutor(max_workers=num_processes,
+                                     mp_context=_get_scenario_mp_context()) as executor:
+                futures = {
+                    name: executor.submit(self._run_scenario_in_process, name, filename, dry_run)
+                    for name, filename in filenames.items()
+                }
+                for name, future in futures.items():
+                    self._estimated_space[name] = future.result()
+            # Leave the config as the sequential loop would.
+            self._simulation_config["Project"]["Active Scenario"] = self._scenarios[-1].name
+
+            driver, kwargs = self._get_store_options(dry_run)
+            with h5py.File(store_filename, mode="w", driver=driver, **kwargs) as hdf_store:
+                self._hdf_store = hdf_store
+                self._hdf_store.attrs["version"] = DATA_FORMAT_VERSION
+                if not dry_run:
+                    for filename in filenames.values():
+                        with h5py.File(filename, mode="r") as scenario_store:
+                            _copy_hdf_group(scenario_store, hdf_store)
+
+    def _run_scenario_in_process(self, scenario_name, store_filename, dry_run):
+        scenario = self.get_scenario(scenario_name)
+        self._simulation_config["Project"]["Active Scenario"] = scenario_name
+        driver, kwargs = self._get_store_options(dry_run)
+        inst = instance()
+        with h5py.File(store_filename, mode="w", driver=driver, **kwargs) as hdf_store:
+            self._hdf_store = hdf_store
+            self._hdf_store.attrs["version"] = DATA_FORMAT_VERSION
+            inst.run(self._simulation_config, self, scenario, dry_run=dry_run)
+        self._hdf_store = None
+        logger.info("Completed scenario %s in process %s", scenario_name, os.getpid())
+        return inst.get_estimated_space()
 
     def _serialize_scenarios(self):
         self._simulation_config["Project"]["Scenarios"] = []
@@ -368,60 +439,59 @@ class PyDssProject:
             )
 
     def _tar_project_files(self, delete=True):
-        orig = os.getcwd()
-        os.chdir(self._project_dir)
-        skip_names = (PROJECT_ZIP, STORE_FILENAME, REPORTS_DIR)
-        try:
-            filename = PROJECT_TAR
-            to_delete = []
-            with tarfile.open(filename, "w") as tar:
-                for name in os.listdir("."):
-                    if name in self._SKIP_ARCHIVE:
+        filename = os.path.join(self._project_dir, PROJECT_TAR)
+        to_delete = []
+        # Not compressed: PyDssTarFileInterface reads members at random and
+        # every backward seek in a compressed stream restarts decompression.
+        # Use zip_project for a compressed archive.
+        with tarfile.open(filename, "w") as tar:
+            with os.scandir(self._project_dir) as entries:
+                for entry in entries:
+                    if entry.name in self._SKIP_ARCHIVE:
                         continue
-                    tar.add(name)
+                    tar.add(entry.path, arcname=entry.name)
                     if delete:
-                        to_delete.append(name)
-
-            for name in to_delete:
-                if os.path.isfile(name):
-                    os.remove(name)
-                else:
-                    shutil.rmtree(name)
+                        to_delete.append(entry.path)
 
-            path = os.path.join(self._project_dir, filename)
-            logger.info("Created project tar file: %s", path)
-        finally:
-            os.chdir(orig)
+        self._delete_paths(to_delete)
+        logger.info("Created project tar file: %s", filename)
 
     def _zip_project_files(self, delete=True):
-        orig = os.getcwd()
-        os.chdir(self._project_dir)
-        try:
-            filename = PROJECT_ZIP
-            to_delete = []
-            with zipfile.ZipFile(filename, "w") as zipf:
-                for root, dirs, files in os.walk("."):
-                    if delete and root == ".":
-                        to_delete += dirs
-                    for filename in files:
-                        if root == "." and filename in self._SKIP_ARCHIVE:
-                            continue
-                        path = os.path.join(root, filename)
-                        zipf.write(path)
-                        # We delete files and directories at the root only.
-                        if delete and root == ".":
-                            to_delete.append(path)
-
-            for name in to_delete:
-                if os.path.isfile(name):
-                    os.remove(name)
+        filename = os.path.join(self._project_dir, PROJECT_ZIP)
+        to_delete = []
+        paths = []
+        with os.scandir(self._project_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    paths += _list_files(entry.path)
+                elif entry.name in self._SKIP_ARCHIVE:
+                    continue
                 else:
-                    shutil.rmtree(name)
+                    paths.append(entry.path)
+                # We delete files and directories at the root only.
+                if delete:
+                    to_delete.append(entry.path)
+
+        with zipfile.ZipFile(filename, "w", compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=ARCHIVE_COMPRESSION_LEVEL) as zipf:
+            for path in paths:
+                arcname = os.path.relpath(path, self._project_dir)
+                if path.endswith(".gz"):
+                    # Already compressed; deflating again would only cost time.
+                    zipf.write(path, arcname=arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zipf.write(path, arcname=arcname)
 
-            path = os.path.join(self._project_dir, filename)
-            logger.info("Created project zip file: %s", path)
-        finally:
-            os.chdir(orig)
+        self._delete_paths(to_delete)
+        logger.info("Created project zip file: %s", filename)
+
+    @staticmethod
+    def _delete_paths(paths):
+        for path in paths:
+            if os.path.isfile(path):
+                os.remove(path)
+            else:
+                shutil.rmtree(path)
 
     @staticmethod
     def load_simulation_config(project_path, simulations_file):
@@ -464,12 +534,13 @@ class PyDssProject:
         #if simulation_file is None:
             #simulation_file = SIMULATION_SETTINGS_FILENAME
 
-        if os.path.exists(os.path.join(path, PROJECT_TAR)):
+        try:
             fs_intf = PyDssTarFileInterface(path)
-        elif os.path.exists(os.path.join(path, PROJECT_ZIP)):
-            fs_intf = PyDssZipFileInterface(path)
-        else:
-            fs_intf = PyDssDirectoryInterface(path, simulation_file)
+        except FileNotFoundError:
+            try:
+                fs_intf = PyDssZipFileInterface(path)
+            except FileNotFoundError:
+                fs_intf = PyDssDirectoryInterface(path, simulation_file)
 
         simulation_config = fs_intf.simulation_config
         if options is not None:
@@ -682,15 +753,7 @@ class PyDssScenario:
 
         """
 
-        path = os.path.join(
-            os.path.dirname(getattr(PyDSS, "__path__")[0]),
-            "PyDSS",
-            "defaults",
-            "pyPlotList",
-            filename_from_enum(visualization_type),
-        )
-
-        return load_data(path)
+        return _load_default_config("pyPlotList", filename_from_enum(visualization_type))
 
     @staticmethod
     def load_controller_config_from_type(controller_type):
@@ -706,15 +769,7 @@ class PyDssScenario:
 
         """
 
-        path = os.path.join(
-            os.path.dirname(getattr(PyDSS, "__path__")[0]),
-            "PyDSS",
-            "defaults",
-            "pyControllerList",
-            filename_from_enum(controller_type),
-        )
-
-        return load_data(path)
+        return _load_default_config("pyControllerList", filename_from_enum(controller_type))
 
     @staticmethod
     def load_export_config_from_mode(export_mode):
@@ -729,15 +784,7 @@ class PyDssScenario:
         dict
 
         """
-        path = os.path.join(
-            os.path.dirname(getattr(PyDSS, "__path__")[0]),
-            "PyDSS",
-            "defaults",
-            "ExportLists",
-            filename_from_enum(export_mode),
-        )
-
-        return load_data(path)
+        return _load_default_config("ExportLists", filename_from_enum(export_mode))
 
     def add_post_process(self, post_process_info):
         """Add a post-process script to a scenario.
@@ -761,6 +808,59 @@ class PyDssScenario:
         logger.info("Appended post-process script %s to %s",
                     post_process_info["script"], self.name)
 
+
+def _load_default_config(directory, filename):
+    # Callers may modify the returned config, so never hand out the cached
+    # instance.
+    return copy.deepcopy(_read_default_config(directory, filename))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_default_config(directory, filename):
+    path = os.path.join(
+        os.path.dirname(getattr(PyDSS, "__path__")[0]),
+        "PyDSS",
+        "defaults",
+        directory,
+        filename,
+    )
+    return load_data(path)
+
+
+def clear_config_cache():
+    """Clear the cache of default configs read from PyDSS/defaults."""
+    _read_default_config.cache_clear()
+
+
+def _get_scenario_mp_context():
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _copy_hdf_group(src, dst):
+    """Recursively copy the contents of an HDF5 group into another group."""
+    for name, item in src.items():
+        if name not in dst:
+            src.copy(item, dst, name=name)
+        elif isinstance(item, h5py.Group):
+            _copy_hdf_group(item, dst[name])
+        else:
+            raise InvalidConfiguration(f"duplicate HDF5 dataset {item.name}")
+
+
+def _list_files(path):
+    """Return the paths of all files in path and its subdirectories."""
+    files = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                files += _list_files(entry.path)
+            else:
+                files.append(entry.path)
+    return files
+
+
 def load_config(path):
     """Return a configuration from files.
 
@@ -773,7 +873,8 @@ def load_config(path):
     dict
 
     """
-    files = [os.path.join(path, x) for x in os.listdir(path) \
-             if os.path.splitext(x)[1] == ".toml"]
+    with os.scandir(path) as entries:
+        files = [x.path for x in entries
+                 if x.is_file() and os.path.splitext(x.name)[1] == ".toml"]
     assert len(files) == 1, "only 1 .toml file is currently supported"
     return load_data(files[0])
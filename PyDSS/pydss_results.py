@@ -12,7 +12,7 @@ import pandas as pd
 
 from PyDSS.dataset_buffer import DatasetBuffer
 from PyDSS.element_options import ElementOptions
-from PyDSS.exceptions import InvalidParameter
+from PyDSS.exceptions import InvalidParameter, InvalidConfiguration
 from PyDSS.pydss_project import PyDssProject
 from PyDSS.reports import Reports, REPORTS, REPORTS_DIR
 from PyDSS.utils.dataframe_utils import read_dataframe, write_dataframe
@@ -57,7 +57,10 @@ class PyDssResults:
         self._scenarios = []
         filename = self._project.get_hdf_store_filename()
         driver = "core" if in_memory else None
-        self._hdf_store = h5py.File(filename, "r", driver=driver)
+        try:
+            self._hdf_store = h5py.File(filename, "r", driver=driver)
+        except FileNotFoundError:
+            raise InvalidConfiguration(f"HDFStore does not exist: {filename}")
 
         if self._project.simulation_config["Exports"]["Log Results"]:
             for name in self._project.list_scenario_names():
@@ -221,6 +224,7 @@ class PyDssScenarioResults:
         self._elem_props = defaultdict(list)
         self._elem_prop_nums = defaultdict(dict)
         self._indices_df = None
+        self._column_indices = {}
         self._add_frequency = frequency
         self._add_mode = mode
         self._data_format_version = self._hdf_store.attrs["version"]
@@ -368,7 +372,9 @@ class PyDssScenarioResults:
 
         if kwargs:
             options = self._check_options(element_class, prop, **kwargs)
-            columns = ValueStorageBase.get_columns(df, element_name, options, **kwargs)
+            columns = ValueStorageBase.get_columns_from_index(
+                self._get_column_index(dataset), element_name, options, **kwargs
+            )
             df = df[columns]
 
         if self._data_format_version == "1.0.0":
@@ -386,7 +392,7 @@ class PyDssScenarioResults:
         if real_only:
             for column in df.columns:
                 if df[column].dtype == np.complex:
-                    df[column] = [x.real for x in df[column]]
+                    df[column] = np.real(df[column].values)
 
         return df
 
@@ -429,12 +435,13 @@ class PyDssScenarioResults:
         if prop not in self.list_element_properties(element_class):
             raise InvalidParameter(f"property {prop} is not stored")
 
-        master_df = None
+        # Collect all dataframes and combine them once. Joining them one at a
+        # time copies the accumulated data for every element.
+        dfs = []
         length = None
         for _, df in self.iterate_dataframes(element_class, prop, real_only=real_only):
             cur_len = len(df)
-            if master_df is None:
-                master_df = df
+            if not dfs:
                 length = cur_len
             else:
                 if cur_len != length:
@@ -444,9 +451,13 @@ class PyDssScenarioResults:
                 for column in ("Frequency", "Simulation Mode"):
                     if column in df.columns:
                         df.drop(column, axis=1, inplace=True)
-                master_df = master_df.join(df)
+            dfs.append(df)
 
-        return master_df
+        if not dfs:
+            return None
+        if len(dfs) == 1:
+            return dfs[0]
+        return pd.concat(dfs, axis=1)
 
     def get_option_values(self, element_class, prop, element_name):
         """Return the option values for the element property.
@@ -460,8 +471,21 @@ class PyDssScenarioResults:
         list
 
         """
-        df = self.get_dataframe(element_class, prop, element_name)
-        return ValueStorageBase.get_option_values(df, element_name)
+        if element_name not in self._elem_props:
+            raise InvalidParameter(f"element {element_name} is not stored")
+
+        dataset = self._group[element_class][element_name][prop]
+        return ValueStorageBase.get_option_values_from_index(
+            self._get_column_index(dataset), element_name
+        )
+
+    def _get_column_index(self, dataset):
+        # Parse each dataset's column names once.
+        index = self._column_indices.get(dataset.name)
+        if index is None:
+            index = ValueStorageBase.build_index(dataset.attrs["columns"])
+            self._column_indices[dataset.name] = index
+        return index
 
     def iterate_dataframes(self, element_class, prop, real_only=False, **kwargs):
         """Returns a generator over the dataframes by element name.
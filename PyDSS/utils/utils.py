@@ -14,6 +14,17 @@ import toml
 
 from PyDSS.exceptions import InvalidParameter
 
+# Optional, faster parsers. Fall back to json/toml if they are not available.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
 
 MAX_PATH_LENGTH = 255
 
@@ -92,13 +103,38 @@ def load_data(filename, **kwargs):
     # TODO:  YAMLLoadWarning: calling yaml.load() without Loader=... is deprecated,
     #  as the default Loader is unsafe. Please read https://msg.pyyaml.org/load for full details.
     mod = _get_module_from_extension(filename, **kwargs)
-    with open(filename) as f_in:
-        data = mod.load(f_in)
+    data = None
+    if not kwargs:
+        data = _load_data_fast(filename, mod)
+    if data is None:
+        with open(filename) as f_in:
+            data = mod.load(f_in)
 
     logger.debug("Loaded data from %s", filename)
     return data
 
 
+def _load_data_fast(filename, mod):
+    """Load the file with a faster parser if one is available. Returns None
+    if the file should be loaded with the default module."""
+    if mod is json and orjson is not None:
+        with open(filename, "rb") as f_in:
+            try:
+                return orjson.loads(f_in.read())
+            except orjson.JSONDecodeError:
+                # orjson is strict; the json module also accepts NaN and Infinity.
+                logger.debug("orjson could not parse %s", filename)
+    elif mod is toml and tomllib is not None:
+        with open(filename, "rb") as f_in:
+            try:
+                return tomllib.load(f_in)
+            except tomllib.TOMLDecodeError:
+                # Keep accepting files that the toml package allows.
+                logger.debug("tomllib could not parse %s", filename)
+
+    return None
+
+
 def get_cli_string():
     """Return the command-line arguments issued.
 
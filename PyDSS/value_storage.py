@@ -25,34 +25,45 @@ class ValueStorageBase(abc.ABC):
         self._dataset = None
 
     @staticmethod
-    def get_columns(df, name, options, **kwargs):
-        """Return the column names in the dataframe that match name and kwargs.
+    def _split_column(column):
+        # [name, option1, option2, ...]
+        index = column.find(" [")
+        if index != -1:
+            column = column[:index]
+        return column.split(ValueStorageBase.DELIMITER)
+
+    @classmethod
+    def build_index(cls, columns):
+        """Build a lookup of column names so that they are only parsed once.
+        Build it once per dataset and pass it to the *_from_index methods.
 
         Parameters
         ----------
-        df : pd.DataFrame
-        name : str
-        kwargs : **kwargs
-            Filter on options. Option values can be strings or regular expressions.
+        columns : list
 
         Returns
         -------
-        list
+        dict
 
         """
+        by_name = {}
+        by_fields = {}
+        for column in columns:
+            fields = tuple(cls._split_column(column))
+            by_name.setdefault(fields[0], []).append((column, fields))
+            by_fields.setdefault(fields, []).append(column)
+
+        return {"by_name": by_name, "by_fields": by_fields}
+
+    @staticmethod
+    def _filter_columns(items, name, options, kwargs):
+        # items is an iterable of (column, fields)
         field_indices = {option: i + 1 for i, option in enumerate(options)}
         columns = []
-        for column in df.columns:
-            col = column
-            index = column.find(" [")
-            if index != -1:
-                col = column[:index]
-            # [name, option1, option2, ...]
-            fields = col.split(ValueStorageBase.DELIMITER)
+        for column, fields in items:
             if options and kwargs:
                 assert len(fields) == 1 + len(options), f"fields={fields} options={options}"
-            _name = fields[0]
-            if _name != name:
+            if fields[0] != name:
                 continue
             match = True
             for key, val in kwargs.items():
@@ -76,8 +87,58 @@ class ValueStorageBase(abc.ABC):
 
         return columns
 
-    @staticmethod
-    def get_option_values(df, name):
+    @classmethod
+    def get_columns(cls, df, name, options, **kwargs):
+        """Return the column names in the dataframe that match name and kwargs.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+        name : str
+        kwargs : **kwargs
+            Filter on options. Option values can be strings or regular expressions.
+
+        Returns
+        -------
+        list
+
+        """
+        columns = df.columns.tolist()
+        items = zip(columns, map(cls._split_column, columns))
+        return cls._filter_columns(items, name, options, kwargs)
+
+    @classmethod
+    def get_columns_from_index(cls, index, name, options, **kwargs):
+        """Return the column names in the index that match name and kwargs.
+
+        Parameters
+        ----------
+        index : dict
+            Return value of build_index
+        name : str
+        kwargs : **kwargs
+            Filter on options. Option values can be strings or regular expressions.
+
+        Returns
+        -------
+        list
+
+        """
+        items = index["by_name"].get(name, [])
+        if options and kwargs and len(kwargs) == len(options) and \
+                all(isinstance(kwargs.get(x), str) for x in options):
+            for _, fields in items:
+                assert len(fields) == 1 + len(options), f"fields={fields} options={options}"
+            key = (name,) + tuple(kwargs[x] for x in options)
+            columns = index["by_fields"].get(key, [])[:]
+            if not columns:
+                raise InvalidParameter(f"{name} does not exist in DataFrame")
+            return columns
+
+        return cls._filter_columns(items, name, options, kwargs)
+
+    @classmethod
+    def get_option_values(cls, df, name):
         """Return the option values parsed from the column names.
 
         Parameters
@@ -90,18 +151,33 @@ class ValueStorageBase(abc.ABC):
         list
 
         """
+        columns = df.columns.tolist()
+        items = zip(columns, map(cls._split_column, columns))
+        return cls._get_option_values(items, name)
+
+    @classmethod
+    def get_option_values_from_index(cls, index, name):
+        """Return the option values parsed from the column names in the index.
+
+        Parameters
+        ----------
+        index : dict
+            Return value of build_index
+        name : str
+
+        Returns
+        -------
+        list
+
+        """
+        return cls._get_option_values(index["by_name"].get(name, []), name)
+
+    @staticmethod
+    def _get_option_values(items, name):
         values = []
-        for column in df.columns:
-            col = column
-            index = column.find(" [")
-            if index != -1:
-                col = column[:index]
-            # [name, option1, option2, ...]
-            fields = col.split(ValueStorageBase.DELIMITER)
-            _name = fields[0]
-            if _name != name:
-                continue
-            values += fields[1:]
+        for _, fields in items:
+            if fields[0] == name:
+                values += fields[1:]
 
         if not values:
             raise InvalidParameter(f"{name} does not exist in DataFrame")
@@ -110,7 +186,8 @@ class ValueStorageBase(abc.ABC):
 
     @abc.abstractmethod
     def make_columns(self):
-        """Return a list of column names
+        """Return a list of column names. The list is built once per instance
+        and must not be modified by callers.
 
         Returns
         -------
@@ -207,17 +284,21 @@ class ValueByList(ValueStorageBase):
             self._value.append(val)
             if self._value_type is None:
                 self._value_type = type(val)
+        self._columns = self._make_columns()
 
     def __iadd__(self, other):
         for i in range(len(self._value)):
             self._value[i] += other.value[i]
         return self
 
-    def make_columns(self):
+    def _make_columns(self):
         return [
             self.DELIMITER.join((self._name, f"{x}")) for x in self._labels
         ]
 
+    def make_columns(self):
+        return self._columns
+
     @property
     def num_columns(self):
         return len(self._labels)
@@ -226,11 +307,12 @@ class ValueByList(ValueStorageBase):
         self._prop = prop
 
         # Update the property inside each label.
-        for i, label in self._labels:
+        for i, label in enumerate(self._labels):
             fields = label.split(self.DELIMITER)
             assert len(fields) == 2
             fields[0] = prop
             self._labels[i] = self.DELIMITER.join(fields)
+        self._columns = self._make_columns()
 
     def set_value(self, value):
         self._value = value
@@ -246,6 +328,9 @@ class ValueByList(ValueStorageBase):
 
 class ValueByNumber(ValueStorageBase):
     """Stores a list of numbers for an element/property."""
+
+    num_columns = 1
+
     def __init__(self, name, prop, value):
         super().__init__()
         assert not isinstance(value, list), str(value)
@@ -257,24 +342,25 @@ class ValueByNumber(ValueStorageBase):
                 f"Data export feature does not support strings: name={name} prop={prop} value={value}"
             )
         self._value = value
+        self._columns = self._make_columns()
 
     def __iadd__(self, other):
         self._value += other.value
         return self
 
-    @property
-    def num_columns(self):
-        return 1
-
     def set_element_property(self, prop):
         self._prop = prop
+        self._columns = self._make_columns()
 
     def set_value(self, value):
         self._value = value
 
-    def make_columns(self):
+    def _make_columns(self):
         return [ValueStorageBase.DELIMITER.join((self._name, self._prop))]
 
+    def make_columns(self):
+        return self._columns
+
     @property
     def value(self):
         return self._value
@@ -315,52 +401,54 @@ class ValueByLabel(ValueStorageBase):
         self._name = name
         self._prop = prop
         self._labels = []
-        self._value = []
         self._value_type = complex if is_complex else float
 
-        n = 2
-        m = int(len(value) / (len(Nodes)*n))
-        value = self.chunk_list(value, n)
-        value = self.chunk_list(value, m)
-
-        # Chunk_list example
-        # X = list(range(12)) , nList= 2
-        # Y = chunk_list(X, nList) -> [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9], [10, 11]]
-        # Given element has 2 terminals m = 12 / (2*2) = 3
-        # Z =  chunk_list(Y, m) - > [
-        #                            [[0, 1], [2, 3], [4, 5]],  Terminal one complex pairs
-        #                            [[6, 7], [8, 9], [10, 11]] Terminal two complex pairs
-        #                            ]
-
-        for i, node_val in enumerate(zip(Nodes, value)):
-            node, val = node_val
-            for v, x in zip(node, val):
+        # Reshape the flat list into (terminal, conductor, pair).
+        # Example: an element with 2 terminals and 3 conductors returns 12
+        # values. [0, 1, ..., 11] -> [
+        #                              [[0, 1], [2, 3], [4, 5]],  Terminal one pairs
+        #                              [[6, 7], [8, 9], [10, 11]] Terminal two pairs
+        #                             ]
+        # Some properties, like SeqCurrents, return a count that does not split
+        # evenly into pairs per terminal. Drop the trailing values that do not
+        # fill a pair on every terminal.
+        num_conductors = len(value) // (len(Nodes) * 2)
+        values = np.asarray(value, dtype=np.float64)[:len(Nodes) * num_conductors * 2]
+        values = values.reshape(len(Nodes), num_conductors, 2)
+        if any(len(node) < num_conductors for node in Nodes):
+            # Only keep the conductors that are connected to a node.
+            values = np.concatenate(
+                [values[i, :len(node)] for i, node in enumerate(Nodes)]
+            )
+
+        if is_complex:
+            self._value = (values[..., 0] + 1j * values[..., 1]).ravel()
+        else:
+            # Pairs are (mag, ang); keep them interleaved to match the labels.
+            self._value = values.ravel()
+
+        for i, node in enumerate(Nodes):
+            for v in node[:num_conductors]:
                 label = '{}{}'.format(phs[v], str(i+1))
                 if is_complex:
                     label += " " + units[0]
                     self._labels.append(label)
-                    self._value += [complex(x[0], x[1])]
                 else:
                     # TODO: only generate labels once.
                     # Should be able to do that with an existing instance.
                     label_mag = label + self.DELIMITER + "mag" + ' ' + units[0]
                     label_ang = label + self.DELIMITER + "ang" + ' ' + units[1]
                     self._labels.extend([label_mag, label_ang])
-                    self._value += [x[0], x[1]]
+        self._columns = self._make_columns()
 
     def __iadd__(self, other):
-        for i in range(len(self._value)):
-            self._value[i] += other.value[i]
+        self._value += other.value
         return self
 
     @property
     def value(self):
         return self._value
 
-    @staticmethod
-    def chunk_list(values, nLists):
-        return  [values[i * nLists:(i + 1) * nLists] for i in range((len(values) + nLists - 1) // nLists)]
-
     @property
     def num_columns(self):
         return len(self._labels)
@@ -371,11 +459,14 @@ class ValueByLabel(ValueStorageBase):
     def set_value(self, value):
         self._value = value
 
-    def make_columns(self):
+    def _make_columns(self):
         return [
             self.DELIMITER.join((self._name, f"{x}")) for x in self._labels
         ]
 
+    def make_columns(self):
+        return self._columns
+
     @property
     def value_type(self):
         return self._value_type
@@ -393,7 +484,7 @@ class ValueContainer:
     }
 
     def __init__(self, value, hdf_store, path, max_size, dataset_property_type, max_chunk_bytes=None,
-                 store_timestamp=False):
+                 store_timestamp=False, compression=None):
         group_name = os.path.dirname(path)
         basename = os.path.basename(path)
         try:
@@ -424,6 +515,7 @@ class ValueContainer:
                 scaleoffset=scaleoffset,
                 max_chunk_bytes=max_chunk_bytes,
                 attributes={"type": DatasetPropertyType.TIMESTAMP.value},
+                compression=compression,
             )
             attributes["timestamp_path"] = timestamp_path
         else:
@@ -438,6 +530,7 @@ class ValueContainer:
             scaleoffset=scaleoffset,
             max_chunk_bytes=max_chunk_bytes,
             attributes=attributes,
+            compression=compression,
         )
 
     @staticmethod
@@ -5,8 +5,10 @@ import tempfile
 import h5py
 import numpy as np
 import pandas as pd
+import pytest
 
 from PyDSS.dataset_buffer import DatasetBuffer
+from PyDSS.exceptions import InvalidParameter
 
 
 def test_dataset_buffer__compute_chunk_count():
@@ -52,8 +54,11 @@ def test_dataset_buffer__write_value():
                 data = np.ones(4)
                 dataset.write_value(data)
             assert dataset._buf_index == 2000 - dataset._chunk_size
+            # Full buffers are written without updating the length attribute.
+            assert "length" not in store["data"].attrs
             dataset.flush_data()
             assert dataset._buf_index == 0
+            assert store["data"].attrs["length"] == max_size
 
         with h5py.File(filename, "r") as store:
             data = store["data"][:]
@@ -70,3 +75,32 @@ def test_dataset_buffer__write_value():
     finally:
         if os.path.exists(filename):
             os.remove(filename)
+
+
+def test_dataset_buffer__compression():
+    filename = os.path.join(tempfile.gettempdir(), "store.h5")
+    try:
+        with h5py.File(filename, "w") as store:
+            columns = ("1", "2")
+            for compression, expected in (("gzip", "gzip"), ("lzf", "lzf"), ("none", None)):
+                dataset = DatasetBuffer(
+                    store, compression, 100, np.float, columns, compression=compression
+                )
+                assert store[compression].compression == expected
+                dataset.write_value(np.ones(2))
+                dataset.flush_data()
+                assert DatasetBuffer.to_dataframe(store[compression]).iloc[0, 1] == 1.0
+
+            with pytest.raises(InvalidParameter):
+                DatasetBuffer(store, "bad", 100, np.float, columns, compression="bad")
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+
+def test_dataset_buffer__compute_chunk_count_wide_row():
+    assert DatasetBuffer.compute_chunk_count(
+        num_columns=10000,
+        max_size=96,
+        dtype=np.complex
+    ) == 1
@@ -5,16 +5,20 @@ import re
 import shutil
 import tempfile
 
+import h5py
+import numpy as np
 import pandas as pd
 import pytest
 
-from PyDSS.common import PROJECT_TAR, PROJECT_ZIP
-from PyDSS.exceptions import InvalidParameter
+from PyDSS.common import PROJECT_TAR, PROJECT_ZIP, ControllerType, ExportMode
+from PyDSS.exceptions import InvalidConfiguration, InvalidParameter
 from PyDSS.pydss_fs_interface import PROJECT_DIRECTORIES, SCENARIOS, STORE_FILENAME
-from PyDSS.pydss_project import PyDssProject, PyDssScenario, DATA_FORMAT_VERSION
+from PyDSS.pydss_project import PyDssProject, PyDssScenario, DATA_FORMAT_VERSION, \
+    clear_config_cache, _copy_hdf_group
 from PyDSS.pydss_results import PyDssResults, PyDssScenarioResults
 from tests.common import RUN_PROJECT_PATH, SCENARIO_NAME, cleanup_project
 from PyDSS.common import SIMULATION_SETTINGS_FILENAME
+from PyDSS.utils.utils import dump_data, load_data
 
 
 PATH = os.path.join(tempfile.gettempdir(), "pydss-projects")
@@ -74,6 +78,21 @@ def test_create_project(pydss_project):
         assert scenarios1[i].post_process_infos == scenarios2[i].post_process_infos
 
 
+def test_default_config_cache():
+    clear_config_cache()
+    config1 = PyDssScenario.load_controller_config_from_type(ControllerType.PV_CONTROLLER)
+    config2 = PyDssScenario.load_controller_config_from_type(ControllerType.PV_CONTROLLER)
+    assert config1 == config2
+    # Modifying one config must not affect later callers.
+    assert config1 is not config2
+    config1.clear()
+    assert PyDssScenario.load_controller_config_from_type(ControllerType.PV_CONTROLLER) == config2
+
+    exports = PyDssScenario.load_export_config_from_mode(ExportMode.EXPORTS)
+    assert exports == PyDssScenario.load_export_config_from_mode(ExportMode.EXPORTS)
+    clear_config_cache()
+
+
 EXPECTED_ELEM_CLASSES_PROPERTIES = {
     "Loads": ["Powers"],
     "PVSystems": ["Pmpp"],
@@ -85,6 +104,58 @@ EXPECTED_ELEM_CLASSES_PROPERTIES = {
 }
 
 
+def test_copy_hdf_group(pydss_project):
+    os.makedirs(PATH)
+    filenames = []
+    for scenario in ("scenario1", "scenario2"):
+        filename = os.path.join(PATH, scenario + ".h5")
+        with h5py.File(filename, mode="w") as hdf_store:
+            dataset = hdf_store.create_dataset(f"Exports/{scenario}/Timestamp", data=np.arange(3.0))
+            dataset.attrs["length"] = 3
+        filenames.append(filename)
+
+    with h5py.File(os.path.join(PATH, STORE_FILENAME), mode="w") as hdf_store:
+        for filename in filenames:
+            with h5py.File(filename, mode="r") as scenario_store:
+                _copy_hdf_group(scenario_store, hdf_store)
+        assert sorted(hdf_store["Exports"].keys()) == ["scenario1", "scenario2"]
+        dataset = hdf_store["Exports/scenario2/Timestamp"]
+        assert list(dataset[:]) == [0.0, 1.0, 2.0]
+        assert dataset.attrs["length"] == 3
+
+        with h5py.File(filenames[0], mode="r") as scenario_store:
+            with pytest.raises(InvalidConfiguration):
+                _copy_hdf_group(scenario_store, hdf_store)
+
+
+def test_num_scenario_processes(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    scenarios = [PyDssScenario(f"scenario{i}") for i in range(3)]
+    simulation_config = {
+        "Project": {"Max Parallel Scenarios": 8},
+        "Plots": {"Create dynamic plots": False},
+    }
+    project = PyDssProject(PATH, "test-project", scenarios, simulation_config)
+    assert project._get_num_scenario_processes() == 3
+
+    simulation_config["Project"]["Max Parallel Scenarios"] = 2
+    assert project._get_num_scenario_processes() == 2
+
+    for max_processes in (0, -1):
+        simulation_config["Project"]["Max Parallel Scenarios"] = max_processes
+        assert project._get_num_scenario_processes() == 1
+
+    simulation_config["Project"]["Max Parallel Scenarios"] = 8
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    assert project._get_num_scenario_processes() == 2
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    assert project._get_num_scenario_processes() == 1
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    simulation_config["Plots"]["Create dynamic plots"] = True
+    assert project._get_num_scenario_processes() == 1
+
+
 def test_run_project_by_property_dirs(cleanup_project):
     run_test_project_by_property(tar_project=False, zip_project=False)
 
@@ -108,6 +179,72 @@ def test_run_project_by_property_err(cleanup_project):
         run_test_project_by_property(tar_project=True, zip_project=True)
 
 
+def _make_two_scenario_project(path, name):
+    project_dir = os.path.join(path, name)
+    shutil.copytree(
+        RUN_PROJECT_PATH,
+        project_dir,
+        ignore=shutil.ignore_patterns("Exports", "Logs", STORE_FILENAME, "simulation-run.toml"),
+    )
+    scenarios_dir = os.path.join(project_dir, SCENARIOS)
+    shutil.copytree(
+        os.path.join(scenarios_dir, SCENARIO_NAME), os.path.join(scenarios_dir, "scenario2")
+    )
+    for scenario in (SCENARIO_NAME, "scenario2"):
+        os.makedirs(os.path.join(project_dir, "Exports", scenario))
+    os.makedirs(os.path.join(project_dir, "Logs"))
+
+    filename = os.path.join(project_dir, SIMULATION_SETTINGS_FILENAME)
+    config = load_data(filename)
+    config["Project"]["Project Path"] = path
+    config["Project"]["Active Project"] = name
+    config["Project"]["Scenarios"].append({"name": "scenario2", "post_process_infos": []})
+    dump_data(config, filename)
+    return project_dir
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_run_project_parallel_scenarios(pydss_project, monkeypatch, dry_run):
+    # Make sure that two workers run even on a single-core host.
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    projects = {}
+    for max_processes in (1, 2):
+        project_dir = _make_two_scenario_project(PATH, f"project{max_processes}")
+        project = PyDssProject.load_project(
+            project_dir, options={"Project": {"Max Parallel Scenarios": max_processes}}
+        )
+        assert project._get_num_scenario_processes() == max_processes
+        project.run(dry_run=dry_run)
+        projects[max_processes] = project
+
+    sequential, parallel = projects[1], projects[2]
+    assert sorted(parallel.estimated_space) == [SCENARIO_NAME, "scenario2"]
+    assert parallel.estimated_space == sequential.estimated_space
+    assert parallel.simulation_config["Project"]["Active Scenario"] == \
+        sequential.simulation_config["Project"]["Active Scenario"]
+    if dry_run:
+        for project in projects.values():
+            assert not os.path.exists(os.path.join(project.project_path, STORE_FILENAME))
+        return
+
+    expected = PyDssResults(sequential.project_path)
+    actual = PyDssResults(parallel.project_path)
+    assert actual._hdf_store.attrs["version"] == DATA_FORMAT_VERSION
+    assert [x.name for x in actual.scenarios] == [x.name for x in expected.scenarios]
+    for exp_scenario, act_scenario in zip(expected.scenarios, actual.scenarios):
+        elem_classes = sorted(exp_scenario.list_element_classes())
+        assert sorted(act_scenario.list_element_classes()) == elem_classes
+        for elem_class in elem_classes:
+            props = sorted(exp_scenario.list_element_properties(elem_class))
+            assert sorted(act_scenario.list_element_properties(elem_class)) == props
+            for prop in props:
+                exp_dfs = list(exp_scenario.iterate_dataframes(elem_class, prop))
+                act_dfs = list(act_scenario.iterate_dataframes(elem_class, prop))
+                assert [x[0] for x in act_dfs] == [x[0] for x in exp_dfs]
+                for (_, exp_df), (_, act_df) in zip(exp_dfs, act_dfs):
+                    pd.testing.assert_frame_equal(act_df, exp_df)
+
+
 def run_test_project_by_property(tar_project, zip_project):
     project = PyDssProject.load_project(RUN_PROJECT_PATH)
     PyDssProject.run_project(
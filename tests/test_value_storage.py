@@ -0,0 +1,175 @@
+
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from PyDSS.exceptions import InvalidParameter
+from PyDSS.value_storage import ValueByLabel, ValueByList, ValueByNumber, ValueStorageBase
+
+
+NODES = [[1, 2], [1, 2]]
+VALUES = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+
+
+def test_value_by_label__complex():
+    value = ValueByLabel("Line.one", "Currents", VALUES, NODES, True, ["[Amps]"])
+    assert isinstance(value.value, np.ndarray)
+    assert value.value.dtype == np.complex128
+    assert list(value.value) == [1 + 2j, 3 + 4j, 5 + 6j, 7 + 8j]
+    assert value.make_columns() == [
+        "Line.one__A1 [Amps]",
+        "Line.one__B1 [Amps]",
+        "Line.one__A2 [Amps]",
+        "Line.one__B2 [Amps]",
+    ]
+    assert value.num_columns == 4
+
+
+def test_value_by_label__mag_ang():
+    value = ValueByLabel(
+        "Line.one", "CurrentsMagAng", VALUES, NODES, False, ["[Amps]", "[Deg]"]
+    )
+    assert value.value.dtype == np.float64
+    assert list(value.value) == VALUES
+    assert value.num_columns == 8
+    assert value.make_columns()[:2] == [
+        "Line.one__A1__mag [Amps]",
+        "Line.one__A1__ang [Deg]",
+    ]
+
+
+def test_value_by_label__iadd():
+    value1 = ValueByLabel("Line.one", "Currents", VALUES, NODES, True, ["[Amps]"])
+    value2 = ValueByLabel("Line.one", "Currents", VALUES, NODES, True, ["[Amps]"])
+    value1 += value2
+    assert list(value1.value) == [2 + 4j, 6 + 8j, 10 + 12j, 14 + 16j]
+
+
+def test_value_by_label__fewer_nodes_than_conductors():
+    value = ValueByLabel("Line.one", "Currents", VALUES, [[1], [1]], True, ["[Amps]"])
+    assert list(value.value) == [1 + 2j, 5 + 6j]
+    assert value.make_columns() == ["Line.one__A1 [Amps]", "Line.one__A2 [Amps]"]
+
+
+def _make_mag_ang_dataframe():
+    value = ValueByLabel(
+        "Line.one", "CurrentsMagAng", VALUES, NODES, False, ["[Amps]", "[Deg]"]
+    )
+    return pd.DataFrame([value.value], columns=value.make_columns())
+
+
+def _get_columns_both_ways(df, name, options, **kwargs):
+    columns = ValueStorageBase.get_columns(df, name, options, **kwargs)
+    index = ValueStorageBase.build_index(df.columns)
+    assert ValueStorageBase.get_columns_from_index(index, name, options, **kwargs) == columns
+    return columns
+
+
+def test_value_storage__get_columns():
+    df = _make_mag_ang_dataframe()
+    options = ["phase_terminal", "mag_ang"]
+    columns = _get_columns_both_ways(
+        df, "Line.one", options, phase_terminal="A1", mag_ang="mag"
+    )
+    assert columns == ["Line.one__A1__mag [Amps]"]
+    assert not df.attrs
+
+    columns = _get_columns_both_ways(
+        df, "Line.one", options, phase_terminal=None, mag_ang="ang"
+    )
+    assert len(columns) == 4
+
+    columns = _get_columns_both_ways(
+        df, "Line.one", options, phase_terminal=re.compile(r"[AB]1"), mag_ang="mag"
+    )
+    assert columns == ["Line.one__A1__mag [Amps]", "Line.one__B1__mag [Amps]"]
+
+    index = ValueStorageBase.build_index(df.columns)
+    with pytest.raises(InvalidParameter):
+        ValueStorageBase.get_columns(df, "Line.two", options, phase_terminal="A1", mag_ang="mag")
+    with pytest.raises(InvalidParameter):
+        ValueStorageBase.get_columns_from_index(
+            index, "Line.two", options, phase_terminal="A1", mag_ang="mag"
+        )
+
+
+def test_value_storage__get_columns_option_mismatch():
+    df = _make_mag_ang_dataframe()
+    index = ValueStorageBase.build_index(df.columns)
+    for kwargs in ({"phase_terminal": "A1"}, {"phase_terminal": None}):
+        with pytest.raises(AssertionError):
+            ValueStorageBase.get_columns(df, "Line.one", ["phase_terminal"], **kwargs)
+        with pytest.raises(AssertionError):
+            ValueStorageBase.get_columns_from_index(index, "Line.one", ["phase_terminal"], **kwargs)
+
+
+def test_value_storage__get_option_values():
+    df = _make_mag_ang_dataframe()[["Line.one__A1__mag [Amps]", "Line.one__A1__ang [Deg]"]]
+    index = ValueStorageBase.build_index(df.columns)
+    expected = ["A1", "mag", "A1", "ang"]
+    assert ValueStorageBase.get_option_values(df, "Line.one") == expected
+    assert ValueStorageBase.get_option_values_from_index(index, "Line.one") == expected
+    with pytest.raises(InvalidParameter):
+        ValueStorageBase.get_option_values_from_index(index, "Line.two")
+
+
+def test_value_by_number():
+    value = ValueByNumber("Line.one", "NormalAmps", 5.0)
+    assert value.num_columns == 1
+    assert ValueByNumber.num_columns == 1
+    assert value.make_columns() == ["Line.one__NormalAmps"]
+    value += ValueByNumber("Line.one", "NormalAmps", 2.0)
+    assert value.value == 7.0
+
+
+def test_value_by_number__set_element_property():
+    value = ValueByNumber("Line.one", "NormalAmps", 5.0)
+    assert value.make_columns() is value.make_columns()
+    value.set_element_property("NormalAmpsSum")
+    assert value.make_columns() == ["Line.one__NormalAmpsSum"]
+
+
+def test_value_by_list__set_element_property():
+    value = ValueByList("Transformer.one", "taps", [1.0, 1.1], ["wdg1", "wdg2"])
+    assert value.num_columns == 2
+    assert value.make_columns() == [
+        "Transformer.one__taps__wdg1",
+        "Transformer.one__taps__wdg2",
+    ]
+    value.set_element_property("tapsSum")
+    assert value.make_columns() == [
+        "Transformer.one__tapsSum__wdg1",
+        "Transformer.one__tapsSum__wdg2",
+    ]
+
+
+def test_value_storage__concat_filtered_dataframes():
+    options = ["phase_terminal", "mag_ang"]
+    dfs = []
+    for mag_ang in ("mag", "ang"):
+        df = _make_mag_ang_dataframe()
+        columns = ValueStorageBase.get_columns(
+            df, "Line.one", options, phase_terminal=None, mag_ang=mag_ang
+        )
+        dfs.append(df[columns])
+    df = pd.concat(dfs, axis=1)
+    assert len(df.columns) == 8
+
+
+def test_value_by_label__uneven_values():
+    value = ValueByLabel("Line.one", "SeqCurrents", [1.0, 2.0, 3.0], [[1, 2, 3]], True, ["[Amps]"])
+    assert list(value.value) == [1 + 2j]
+    assert value.make_columns() == ["Line.one__A1 [Amps]"]
+
+    value = ValueByLabel(
+        "Line.one", "SeqCurrents", VALUES[:6], [[1, 2, 3], [1, 2, 3]], False, ["[Amps]", "[Deg]"]
+    )
+    assert list(value.value) == [1.0, 2.0, 3.0, 4.0]
+    assert value.make_columns() == [
+        "Line.one__A1__mag [Amps]",
+        "Line.one__A1__ang [Deg]",
+        "Line.one__A2__mag [Amps]",
+        "Line.one__A2__ang [Deg]",
+    ]